@@ -11,8 +11,9 @@ import subprocess
 import os
 import threading
 
+import watchlist_checker
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-CHECKER_SCRIPT = os.path.join(SCRIPT_DIR, "watchlist_checker.py")
 HTML_FILE = os.path.join(SCRIPT_DIR, "watchlist.html")
 
 
@@ -30,11 +31,13 @@ class WatchlistApp(rumps.App):
             None,  # Separator
             rumps.MenuItem("Quit", callback=self.quit_app),
         ]
-        self.is_checking = False
+        # Lock instead of a bool: two quick clicks could both see the flag
+        # unset before either thread flipped it
+        self._check_lock = threading.Lock()
 
     def check_watchlist(self, _):
         """Run the watchlist checker and open results."""
-        if self.is_checking:
+        if not self._check_lock.acquire(blocking=False):
             rumps.notification(
                 title="Watchlist Checker",
                 subtitle="Already running",
@@ -42,7 +45,6 @@ class WatchlistApp(rumps.App):
             )
             return
 
-        self.is_checking = True
         self.title = "⏳"  # Show loading indicator
 
         # Run in background thread to not block the UI
@@ -51,35 +53,14 @@ class WatchlistApp(rumps.App):
         thread.start()
 
     def _run_checker(self):
-        """Run the checker script in background."""
+        """Run the checker in background."""
         try:
-            result = subprocess.run(
-                ["python3", CHECKER_SCRIPT],
-                cwd=SCRIPT_DIR,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            if result.returncode == 0:
-                rumps.notification(
-                    title="Watchlist Updated",
-                    subtitle="",
-                    message="Your streaming guide is ready!"
-                )
-            else:
-                rumps.notification(
-                    title="Error",
-                    subtitle="",
-                    message="Failed to check watchlist. See terminal for details."
-                )
-                print(result.stderr)
-
-        except subprocess.TimeoutExpired:
+            # Calling in-process skips a fresh interpreter start per check
+            watchlist_checker.main()
             rumps.notification(
-                title="Timeout",
+                title="Watchlist Updated",
                 subtitle="",
-                message="Watchlist check took too long."
+                message="Your streaming guide is ready!"
             )
         except Exception as e:
             rumps.notification(
@@ -88,8 +69,8 @@ class WatchlistApp(rumps.App):
                 message=str(e)
             )
         finally:
-            self.is_checking = False
             self.title = "🎬"
+            self._check_lock.release()
 
     def open_results(self, _):
         """Open the last generated HTML file."""
@@ -3,20 +3,47 @@
 Letterboxd Watchlist Streaming Checker - Fast Edition
 """
 
+import asyncio
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import atexit
+import html
 import re
 import os
+import pickle
+import shelve
 import webbrowser
 import json
+from urllib.parse import quote
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(SCRIPT_DIR, "config.json")
-CACHE_FILE = os.path.join(SCRIPT_DIR, ".cache.json")
+CACHE_FILE = os.path.join(SCRIPT_DIR, ".cache.pkl")
+JW_CACHE_FILE = os.path.join(SCRIPT_DIR, ".jw_cache.db")
 CACHE_HOURS = 6
+FILMS_PER_PAGE = 28  # Letterboxd watchlist page size
+POOL_SIZE = 16  # shared by the session's connection pool and the page executor
+
+# Transient statuses worth retrying, shared by the session's Retry policy
+# and the JustWatch retry loop
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Letterboxd stores titles as "Parasite (2019)"; strip the year for matching
+_YEAR_RE = re.compile(r'\s*\(\d{4}\)\s*$')
+
+
+@lru_cache(maxsize=None)
+def _clean_title(name):
+    return _YEAR_RE.sub('', name).strip()
+
 
 # Default config (your settings)
 DEFAULT_CONFIG = {
@@ -39,56 +66,122 @@ LETTERBOXD_USERNAME = CONFIG.get("username", "mrbeeef")
 USER_SERVICES = CONFIG.get("services", ["Netflix", "Amazon Prime Video", "Hulu", "Max"])
 USER_NAME = CONFIG.get("name", "friend")
 
+# Matching is substring-based in both directions ("Max" vs "Max Amazon
+# Channel"), so lowercase the user's services once instead of per film
+_USER_SERVICES_LC = [(svc, svc.lower()) for svc in USER_SERVICES]
+
+# Shared session so every request reuses the same keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per film
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=POOL_SIZE,
+    pool_maxsize=POOL_SIZE,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=RETRY_STATUSES)
+))
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Content-Type": "application/json",
+})
+
+
+_JW_CACHE = None
+
+
+def _jw_cache():
+    """Open the per-slug cache once and reuse the handle across runs.
+
+    The menu bar app keeps this module alive between checks, so like
+    SESSION the handle survives from one check to the next instead of
+    being reopened every time.
+    """
+    global _JW_CACHE
+    if _JW_CACHE is None:
+        _JW_CACHE = shelve.open(JW_CACHE_FILE)
+        atexit.register(_JW_CACHE.close)
+    return _JW_CACHE
+
 
 def load_cache():
     try:
         if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, 'r') as f:
-                cache = json.load(f)
-                if datetime.fromisoformat(cache.get('timestamp', '2000-01-01')) > datetime.now() - timedelta(hours=CACHE_HOURS):
+            with open(CACHE_FILE, 'rb') as f:
+                cache = pickle.load(f)
+                if cache.get('timestamp', datetime.min) > datetime.now() - timedelta(hours=CACHE_HOURS):
                     return cache.get('data')
-    except:
+    except Exception:
         pass
     return None
 
 
 def save_cache(data):
+    # Write to a temp file and rename so a crash mid-write can never leave
+    # a truncated cache behind
     try:
-        with open(CACHE_FILE, 'w') as f:
-            json.dump({'timestamp': datetime.now().isoformat(), 'data': data}, f)
-    except:
+        tmp = CACHE_FILE + ".tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump({'timestamp': datetime.now(), 'data': data}, f)
+        os.replace(tmp, CACHE_FILE)
+    except Exception:
         pass
 
 
-def get_watchlist_films(username):
+def parse_watchlist_page(soup):
     films = []
-    page = 1
-    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+    for el in soup.select("div[data-component-class='LazyPoster']"):
+        name = el.get("data-item-name", "")
+        slug = el.get("data-item-slug", "")
+        if name and slug:
+            films.append({"name": name, "slug": slug})
+    return films
+
 
-    while True:
+def get_watchlist_films(username):
+    def fetch_page(page):
         url = f"https://letterboxd.com/{username}/watchlist/page/{page}/"
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, timeout=10)
         if response.status_code != 200:
-            break
+            return None
+        return BeautifulSoup(response.text, "lxml")
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        film_elements = soup.select("div[data-component-class='LazyPoster']")
-        if not film_elements:
-            break
+    # Page 1 tells us how many pages there are, so fetch the rest in parallel
+    # instead of walking them one RTT at a time
+    first = fetch_page(1)
+    if first is None:
+        return []
 
-        for el in film_elements:
-            name = el.get("data-item-name", "")
-            slug = el.get("data-item-slug", "")
-            if name and slug:
-                films.append({"name": name, "slug": slug})
-        page += 1
+    films = parse_watchlist_page(first)
+
+    last_page_link = first.select_one(".paginate-pages li:last-child a")
+    try:
+        max_page = int(last_page_link.get_text(strip=True))
+    except (AttributeError, ValueError):
+        max_page = 1
+
+    if max_page > 1:
+        # No more threads than pages, and never wider than the connection
+        # pool, so no worker ever waits on a pool slot
+        with ThreadPoolExecutor(max_workers=min(POOL_SIZE, max_page - 1)) as executor:
+            for soup in executor.map(fetch_page, range(2, max_page + 1)):
+                if soup is not None:
+                    films.extend(parse_watchlist_page(soup))
+    elif len(films) >= FILMS_PER_PAGE:
+        # Pagination markup missing but page 1 is full: walk forward and
+        # stop at the first short page instead of probing past the end
+        page = 2
+        while True:
+            soup = fetch_page(page)
+            page_films = parse_watchlist_page(soup) if soup is not None else []
+            films.extend(page_films)
+            if len(page_films) < FILMS_PER_PAGE:
+                break
+            page += 1
 
     return films
 
 
-def search_justwatch(film):
+async def search_justwatch(client, film):
     """Search JustWatch for a single film."""
-    search_query = re.sub(r'\s*\(\d{4}\)\s*$', '', film["name"]).strip()
+    search_query = _clean_title(film["name"])
 
     query = """
     query GetSearchTitles($searchTitlesFilter: TitleFilter!, $country: Country!, $language: Language!) {
@@ -97,7 +190,6 @@ def search_justwatch(film):
                 node {
                     content(country: $country, language: $language) {
                         title
-                        originalReleaseYear
                         posterUrl
                     }
                     offers(country: $country, platform: WEB) {
@@ -112,33 +204,41 @@ def search_justwatch(film):
     """
 
     try:
-        response = requests.post(
-            "https://apis.justwatch.com/graphql",
-            json={"query": query, "variables": {
-                "searchTitlesFilter": {"searchQuery": search_query, "objectTypes": ["MOVIE"]},
-                "country": "US", "language": "en"
-            }},
-            headers={"User-Agent": "Mozilla/5.0", "Content-Type": "application/json"},
-            timeout=8
-        )
+        # Transport retries only cover connect failures; retry rate limits
+        # and server errors here with the same backoff as the session
+        for attempt in range(3):
+            response = await client.post(
+                "https://apis.justwatch.com/graphql",
+                json={"query": query, "variables": {
+                    "searchTitlesFilter": {"searchQuery": search_query, "objectTypes": ["MOVIE"]},
+                    "country": "US", "language": "en"
+                }},
+                timeout=8
+            )
+            if response.status_code not in RETRY_STATUSES:
+                break
+            await asyncio.sleep(0.3 * (2 ** attempt))
 
         if response.status_code != 200:
-            return {**film, "services": {}, "poster_url": None}
+            return {**film, "services": {}, "poster_url": None, "failed": True}
 
-        edges = response.json().get("data", {}).get("popularTitles", {}).get("edges", [])
+        # GraphQL errors come back as HTTP 200 with explicit nulls, so
+        # .get defaults alone don't protect this parse
+        payload = orjson.loads(response.content)
+        edges = ((payload.get("data") or {}).get("popularTitles") or {}).get("edges") or []
 
         clean_name = search_query.lower()
         for edge in edges:
-            node = edge.get("node", {})
-            content = node.get("content", {})
-            title = content.get("title", "").lower()
+            node = edge.get("node") or {}
+            content = node.get("content") or {}
+            title = (content.get("title") or "").lower()
 
             if title == clean_name or clean_name in title or title in clean_name:
                 offers = node.get("offers") or []
                 services = {}
                 for offer in offers:
                     if offer.get("monetizationType") == "FLATRATE":
-                        svc = offer.get("package", {}).get("clearName", "")
+                        svc = (offer.get("package") or {}).get("clearName", "")
                         url = offer.get("standardWebURL", "")
                         if svc and svc not in services:
                             services[svc] = url
@@ -151,66 +251,401 @@ def search_justwatch(film):
 
         return {**film, "services": {}, "poster_url": None}
 
-    except:
-        return {**film, "services": {}, "poster_url": None}
+    except (httpx.HTTPError, orjson.JSONDecodeError):
+        return {**film, "services": {}, "poster_url": None, "failed": True}
 
 
 def check_all_films(films):
-    """Check all films in parallel."""
-    results = {"available": [], "unavailable": []}
+    """Check all films concurrently over a single HTTP/2 connection."""
+    results = {"available": [], "unavailable": [],
+               "by_service": {"Max": [], "Netflix": [], "Amazon Prime Video": [], "Hulu": []}}
 
     print(f"Checking {len(films)} films...", flush=True)
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = {executor.submit(search_justwatch, film): film for film in films}
-
-        for future in as_completed(futures):
-            film_data = future.result()
-
-            # Check if on user's services
-            matched_service = None
-            stream_url = None
-            for user_svc in USER_SERVICES:
-                for jw_svc, url in film_data.get("services", {}).items():
-                    if user_svc.lower() in jw_svc.lower() or jw_svc.lower() in user_svc.lower():
-                        matched_service = user_svc
-                        stream_url = url
-                        break
-                if matched_service:
+    # Per-slug cache: only films we have never seen (or whose entry has
+    # expired) go out to JustWatch, the rest are served from disk
+    film_data_list = []
+    stale = []
+    cutoff = datetime.now() - timedelta(hours=CACHE_HOURS)
+
+    db = _jw_cache()
+    for film in films:
+        entry = db.get(film["slug"])
+        if entry and datetime.fromisoformat(entry["fetched_at"]) > cutoff:
+            film_data_list.append({**film, "services": entry["services"],
+                                   "poster_url": entry["poster_url"]})
+        else:
+            stale.append(film)
+
+    if stale:
+        async def run():
+            limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            # gzip/deflate only: advertising br without a brotli decoder
+            # installed makes httpx raise DecodingError on the response
+            headers = {"User-Agent": "Mozilla/5.0", "Content-Type": "application/json",
+                       "Accept-Encoding": "gzip, deflate"}
+            # Connect failures retry in the transport, mirroring the
+            # Retry policy on the pooled requests session
+            transport = httpx.AsyncHTTPTransport(retries=2, http2=True, limits=limits)
+            async with httpx.AsyncClient(transport=transport, headers=headers) as client:
+                return await asyncio.gather(*(search_justwatch(client, film) for film in stale))
+
+        fetched_at = datetime.now().isoformat()
+        for film_data in asyncio.run(run()):
+            # Failed lookups still render as unavailable for this run, but
+            # aren't cached as an authoritative "no services" for 6 hours
+            if not film_data.pop("failed", False):
+                db[film_data["slug"]] = {"services": film_data["services"],
+                                         "poster_url": film_data["poster_url"],
+                                         "fetched_at": fetched_at}
+            film_data_list.append(film_data)
+        db.sync()
+
+    for film_data in film_data_list:
+        # Check if on user's services
+        matched_service = None
+        stream_url = None
+        services_lc = [(jw_svc.lower(), url) for jw_svc, url in film_data.get("services", {}).items()]
+        for user_svc, user_lc in _USER_SERVICES_LC:
+            for jw_lc, url in services_lc:
+                if user_lc in jw_lc or jw_lc in user_lc:
+                    matched_service = user_svc
+                    stream_url = url
                     break
-
             if matched_service:
-                results["available"].append({
-                    "name": film_data["name"],
-                    "slug": film_data["slug"],
-                    "service": matched_service,
-                    "stream_url": stream_url,
-                    "poster_url": film_data.get("poster_url")
-                })
-            else:
-                other = list(film_data.get("services", {}).keys())[:2]
-                results["unavailable"].append({
-                    "name": film_data["name"],
-                    "slug": film_data["slug"],
-                    "other_services": other,
-                    "poster_url": film_data.get("poster_url")
-                })
+                break
+
+        title = _clean_title(film_data["name"])
+
+        if matched_service:
+            entry = {
+                "name": film_data["name"],
+                "title": title,
+                "slug": film_data["slug"],
+                "service": matched_service,
+                "stream_url": stream_url,
+                "poster_url": film_data.get("poster_url")
+            }
+            results["available"].append(entry)
+            if matched_service in results["by_service"]:
+                results["by_service"][matched_service].append(entry)
+        else:
+            other = list(film_data.get("services", {}).keys())[:2]
+            results["unavailable"].append({
+                "name": film_data["name"],
+                "title": title,
+                "slug": film_data["slug"],
+                "other_services": other,
+                "poster_url": film_data.get("poster_url")
+            })
 
     return results
 
 
+# Static stylesheet, written next to watchlist.html so the browser can
+# cache it instead of re-downloading ~8 KB of CSS inside every render
+PAGE_CSS = """\
+:root {
+    --bg-dark: #14181c;
+    --bg-darker: #0d1114;
+    --bg-card: #242c34;
+    --bg-hover: #2c3440;
+    --border: #303840;
+    --text: #9ab;
+    --text-bright: #fff;
+    --green: #00e054;
+    --orange: #ff8000;
+    --blue: #40bcf4;
+}
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: 'Graphik', -apple-system, BlinkMacSystemFont, sans-serif;
+    background: var(--bg-darker);
+    color: var(--text);
+    min-height: 100vh;
+    font-size: 14px;
+    line-height: 1.5;
+}
+a { color: inherit; text-decoration: none; }
+
+/* Header */
+.header {
+    background: var(--bg-dark);
+    border-bottom: 1px solid var(--border);
+    padding: 0 40px;
+    position: sticky;
+    top: 0;
+    z-index: 100;
+}
+.header-inner {
+    max-width: 1200px;
+    margin: 0 auto;
+    height: 56px;
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+}
+.logo {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+    color: var(--text-bright);
+    font-weight: 600;
+    font-size: 15px;
+    letter-spacing: 0.5px;
+}
+.logo-dots {
+    display: flex;
+    gap: 2px;
+}
+.logo-dot {
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+}
+.logo-dot:nth-child(1) { background: var(--orange); }
+.logo-dot:nth-child(2) { background: var(--green); }
+.logo-dot:nth-child(3) { background: var(--blue); }
+.nav {
+    display: flex;
+    gap: 24px;
+    font-size: 13px;
+    text-transform: uppercase;
+    letter-spacing: 0.1em;
+}
+.nav a {
+    color: var(--text);
+    transition: color 0.15s;
+}
+.nav a:hover, .nav a.active {
+    color: var(--text-bright);
+}
+
+/* Hero */
+.hero {
+    background: linear-gradient(to bottom, var(--bg-dark), var(--bg-darker));
+    padding: 50px 40px 60px;
+    text-align: center;
+    border-bottom: 1px solid var(--border);
+}
+.hero h1 {
+    color: var(--text-bright);
+    font-size: 28px;
+    font-weight: 600;
+    margin-bottom: 8px;
+    letter-spacing: -0.01em;
+}
+.hero h1 span {
+    color: var(--green);
+}
+.hero-sub {
+    color: var(--text);
+    font-size: 15px;
+}
+.hero-stats {
+    display: flex;
+    justify-content: center;
+    gap: 40px;
+    margin-top: 30px;
+}
+.stat {
+    text-align: center;
+}
+.stat-num {
+    font-size: 32px;
+    font-weight: 600;
+    color: var(--text-bright);
+    line-height: 1;
+}
+.stat-label {
+    font-size: 11px;
+    text-transform: uppercase;
+    letter-spacing: 0.15em;
+    margin-top: 6px;
+    color: var(--text);
+}
+
+/* Main */
+.main {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 40px;
+}
+
+/* Section */
+.section {
+    margin-bottom: 50px;
+}
+.section-header {
+    display: flex;
+    align-items: center;
+    gap: 12px;
+    margin-bottom: 20px;
+    padding-bottom: 12px;
+    border-bottom: 1px solid var(--border);
+}
+.service-icon {
+    width: 28px;
+    height: 28px;
+    border-radius: 4px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: 600;
+    font-size: 12px;
+    color: #fff;
+}
+.service-icon.netflix { background: #e50914; }
+.service-icon.max { background: #002be7; }
+.service-icon.prime { background: #00a8e1; }
+.service-icon.hulu { background: #1ce783; color: #000; }
+.service-icon.none { background: var(--bg-card); color: var(--text); }
+.section-title {
+    font-size: 16px;
+    font-weight: 500;
+    color: var(--text-bright);
+    flex: 1;
+}
+.section-count {
+    font-size: 12px;
+    color: var(--text);
+    background: var(--bg-card);
+    padding: 3px 10px;
+    border-radius: 10px;
+}
+
+/* Poster Grid - Letterboxd style */
+.posters {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
+    gap: 8px;
+}
+.poster-card {
+    position: relative;
+    border-radius: 4px;
+    overflow: hidden;
+    background: var(--bg-card);
+    transition: transform 0.15s ease, box-shadow 0.15s ease;
+    cursor: pointer;
+}
+.poster-card:hover {
+    transform: translateY(-4px);
+    box-shadow: 0 8px 24px rgba(0,0,0,0.4);
+}
+.poster-card::before {
+    content: '';
+    position: absolute;
+    inset: 0;
+    border: 1px solid rgba(255,255,255,0.1);
+    border-radius: 4px;
+    pointer-events: none;
+    z-index: 2;
+}
+.poster-card:hover::before {
+    border-color: var(--green);
+    box-shadow: inset 0 0 0 1px var(--green);
+}
+.poster-img {
+    width: 100%;
+    aspect-ratio: 2/3;
+    object-fit: cover;
+    display: block;
+}
+.poster-placeholder {
+    width: 100%;
+    aspect-ratio: 2/3;
+    background: linear-gradient(135deg, var(--bg-card), var(--bg-hover));
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    padding: 16px;
+    text-align: center;
+    font-size: 12px;
+    color: var(--text);
+}
+.poster-overlay {
+    position: absolute;
+    inset: 0;
+    background: linear-gradient(to top, rgba(0,0,0,0.8) 0%, transparent 60%);
+    opacity: 0;
+    transition: opacity 0.2s;
+    display: flex;
+    flex-direction: column;
+    justify-content: flex-end;
+    padding: 12px;
+}
+.poster-card:hover .poster-overlay {
+    opacity: 1;
+}
+.poster-title {
+    font-size: 13px;
+    font-weight: 500;
+    color: #fff;
+    line-height: 1.3;
+}
+.poster-service {
+    font-size: 10px;
+    text-transform: uppercase;
+    letter-spacing: 0.1em;
+    margin-top: 4px;
+    color: var(--green);
+}
+
+/* Unavailable */
+.unavailable .poster-card {
+    opacity: 0.5;
+}
+.unavailable .poster-card:hover {
+    opacity: 0.8;
+}
+.unavailable .poster-card:hover::before {
+    border-color: var(--text);
+    box-shadow: none;
+}
+.unavailable .poster-service {
+    color: var(--text);
+}
+
+/* Footer */
+.footer {
+    text-align: center;
+    padding: 40px;
+    color: var(--text);
+    font-size: 12px;
+    border-top: 1px solid var(--border);
+    margin-top: 40px;
+}
+.footer a {
+    color: var(--green);
+}
+"""
+
+
 def generate_html(results):
     available = results["available"]
     unavailable = results["unavailable"]
 
-    # Group by service
-    by_service = {"Max": [], "Netflix": [], "Amazon Prime Video": [], "Hulu": []}
-    for film in available:
-        svc = film["service"]
-        if svc in by_service:
-            by_service[svc].append(film)
-
-    html = f"""<!DOCTYPE html>
+    # Grouped while checking; rebuild only for results cached before
+    # by_service existed
+    by_service = results.get("by_service")
+    if by_service is None:
+        by_service = {"Max": [], "Netflix": [], "Amazon Prime Video": [], "Hulu": []}
+        for film in available:
+            svc = film["service"]
+            if svc in by_service:
+                by_service[svc].append(film)
+
+    # Preload the first row of posters so the top of the page paints right
+    # away; everything below the fold stays loading="lazy"
+    first_row = next((films for films in by_service.values() if films), [])
+    preload_links = "".join(
+        f'    <link rel="preload" as="image" href="{html.escape(film["poster_url"])}">\n'
+        for film in first_row[:6] if film.get("poster_url")
+    )
+
+    # Build the page as a list of fragments; repeated += on a big string
+    # recopies the whole document every time
+    parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -219,282 +654,8 @@ def generate_html(results):
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Graphik:wght@400;500;600&display=swap" rel="stylesheet">
-    <style>
-        :root {{
-            --bg-dark: #14181c;
-            --bg-darker: #0d1114;
-            --bg-card: #242c34;
-            --bg-hover: #2c3440;
-            --border: #303840;
-            --text: #9ab;
-            --text-bright: #fff;
-            --green: #00e054;
-            --orange: #ff8000;
-            --blue: #40bcf4;
-        }}
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Graphik', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: var(--bg-darker);
-            color: var(--text);
-            min-height: 100vh;
-            font-size: 14px;
-            line-height: 1.5;
-        }}
-        a {{ color: inherit; text-decoration: none; }}
-
-        /* Header */
-        .header {{
-            background: var(--bg-dark);
-            border-bottom: 1px solid var(--border);
-            padding: 0 40px;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-        }}
-        .header-inner {{
-            max-width: 1200px;
-            margin: 0 auto;
-            height: 56px;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        .logo {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            color: var(--text-bright);
-            font-weight: 600;
-            font-size: 15px;
-            letter-spacing: 0.5px;
-        }}
-        .logo-dots {{
-            display: flex;
-            gap: 2px;
-        }}
-        .logo-dot {{
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-        }}
-        .logo-dot:nth-child(1) {{ background: var(--orange); }}
-        .logo-dot:nth-child(2) {{ background: var(--green); }}
-        .logo-dot:nth-child(3) {{ background: var(--blue); }}
-        .nav {{
-            display: flex;
-            gap: 24px;
-            font-size: 13px;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-        }}
-        .nav a {{
-            color: var(--text);
-            transition: color 0.15s;
-        }}
-        .nav a:hover, .nav a.active {{
-            color: var(--text-bright);
-        }}
-
-        /* Hero */
-        .hero {{
-            background: linear-gradient(to bottom, var(--bg-dark), var(--bg-darker));
-            padding: 50px 40px 60px;
-            text-align: center;
-            border-bottom: 1px solid var(--border);
-        }}
-        .hero h1 {{
-            color: var(--text-bright);
-            font-size: 28px;
-            font-weight: 600;
-            margin-bottom: 8px;
-            letter-spacing: -0.01em;
-        }}
-        .hero h1 span {{
-            color: var(--green);
-        }}
-        .hero-sub {{
-            color: var(--text);
-            font-size: 15px;
-        }}
-        .hero-stats {{
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            margin-top: 30px;
-        }}
-        .stat {{
-            text-align: center;
-        }}
-        .stat-num {{
-            font-size: 32px;
-            font-weight: 600;
-            color: var(--text-bright);
-            line-height: 1;
-        }}
-        .stat-label {{
-            font-size: 11px;
-            text-transform: uppercase;
-            letter-spacing: 0.15em;
-            margin-top: 6px;
-            color: var(--text);
-        }}
-
-        /* Main */
-        .main {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 40px;
-        }}
-
-        /* Section */
-        .section {{
-            margin-bottom: 50px;
-        }}
-        .section-header {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            margin-bottom: 20px;
-            padding-bottom: 12px;
-            border-bottom: 1px solid var(--border);
-        }}
-        .service-icon {{
-            width: 28px;
-            height: 28px;
-            border-radius: 4px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 600;
-            font-size: 12px;
-            color: #fff;
-        }}
-        .service-icon.netflix {{ background: #e50914; }}
-        .service-icon.max {{ background: #002be7; }}
-        .service-icon.prime {{ background: #00a8e1; }}
-        .service-icon.hulu {{ background: #1ce783; color: #000; }}
-        .service-icon.none {{ background: var(--bg-card); color: var(--text); }}
-        .section-title {{
-            font-size: 16px;
-            font-weight: 500;
-            color: var(--text-bright);
-            flex: 1;
-        }}
-        .section-count {{
-            font-size: 12px;
-            color: var(--text);
-            background: var(--bg-card);
-            padding: 3px 10px;
-            border-radius: 10px;
-        }}
-
-        /* Poster Grid - Letterboxd style */
-        .posters {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-            gap: 8px;
-        }}
-        .poster-card {{
-            position: relative;
-            border-radius: 4px;
-            overflow: hidden;
-            background: var(--bg-card);
-            transition: transform 0.15s ease, box-shadow 0.15s ease;
-            cursor: pointer;
-        }}
-        .poster-card:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 8px 24px rgba(0,0,0,0.4);
-        }}
-        .poster-card::before {{
-            content: '';
-            position: absolute;
-            inset: 0;
-            border: 1px solid rgba(255,255,255,0.1);
-            border-radius: 4px;
-            pointer-events: none;
-            z-index: 2;
-        }}
-        .poster-card:hover::before {{
-            border-color: var(--green);
-            box-shadow: inset 0 0 0 1px var(--green);
-        }}
-        .poster-img {{
-            width: 100%;
-            aspect-ratio: 2/3;
-            object-fit: cover;
-            display: block;
-        }}
-        .poster-placeholder {{
-            width: 100%;
-            aspect-ratio: 2/3;
-            background: linear-gradient(135deg, var(--bg-card), var(--bg-hover));
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 16px;
-            text-align: center;
-            font-size: 12px;
-            color: var(--text);
-        }}
-        .poster-overlay {{
-            position: absolute;
-            inset: 0;
-            background: linear-gradient(to top, rgba(0,0,0,0.8) 0%, transparent 60%);
-            opacity: 0;
-            transition: opacity 0.2s;
-            display: flex;
-            flex-direction: column;
-            justify-content: flex-end;
-            padding: 12px;
-        }}
-        .poster-card:hover .poster-overlay {{
-            opacity: 1;
-        }}
-        .poster-title {{
-            font-size: 13px;
-            font-weight: 500;
-            color: #fff;
-            line-height: 1.3;
-        }}
-        .poster-service {{
-            font-size: 10px;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            margin-top: 4px;
-            color: var(--green);
-        }}
-
-        /* Unavailable */
-        .unavailable .poster-card {{
-            opacity: 0.5;
-        }}
-        .unavailable .poster-card:hover {{
-            opacity: 0.8;
-        }}
-        .unavailable .poster-card:hover::before {{
-            border-color: var(--text);
-            box-shadow: none;
-        }}
-        .unavailable .poster-service {{
-            color: var(--text);
-        }}
-
-        /* Footer */
-        .footer {{
-            text-align: center;
-            padding: 40px;
-            color: var(--text);
-            font-size: 12px;
-            border-top: 1px solid var(--border);
-            margin-top: 40px;
-        }}
-        .footer a {{
-            color: var(--green);
-        }}
-    </style>
-</head>
+    <link rel="stylesheet" href="style.css">
+{preload_links}</head>
 <body>
     <header class="header">
         <div class="header-inner">
@@ -504,7 +665,7 @@ def generate_html(results):
                     <div class="logo-dot"></div>
                     <div class="logo-dot"></div>
                 </div>
-                {USER_NAME}'s watchlist
+                {html.escape(USER_NAME)}'s watchlist
             </div>
             <nav class="nav">
                 <a href="https://letterboxd.com/mrbeeef/watchlist/" target="_blank">Full List</a>
@@ -529,7 +690,7 @@ def generate_html(results):
     </div>
 
     <main class="main">
-"""
+"""]
 
     service_config = [
         ("Max", "max", "M"),
@@ -545,7 +706,7 @@ def generate_html(results):
 
         display_name = "Prime Video" if svc_name == "Amazon Prime Video" else svc_name
 
-        html += f"""
+        parts.append(f"""
         <section class="section">
             <div class="section-header">
                 <div class="service-icon {css_class}">{letter}</div>
@@ -553,32 +714,32 @@ def generate_html(results):
                 <span class="section-count">{len(films)} film{"s" if len(films) != 1 else ""}</span>
             </div>
             <div class="posters">
-"""
+""")
         for film in films:
-            title = re.sub(r'\s*\(\d{4}\)\s*$', '', film["name"])
-            url = film.get("stream_url") or f"https://letterboxd.com/film/{film['slug']}/"
-            poster = film.get("poster_url")
+            title = html.escape(film.get("title") or _clean_title(film["name"]))
+            url = html.escape(film.get("stream_url") or f"https://letterboxd.com/film/{quote(film['slug'])}/")
+            poster = html.escape(film["poster_url"]) if film.get("poster_url") else None
 
             if poster:
                 img_html = f'<img class="poster-img" src="{poster}" alt="{title}" loading="lazy">'
             else:
                 img_html = f'<div class="poster-placeholder">{title}</div>'
 
-            html += f"""                <a href="{url}" target="_blank" class="poster-card">
+            parts.append(f"""                <a href="{url}" target="_blank" class="poster-card">
                     {img_html}
                     <div class="poster-overlay">
                         <div class="poster-title">{title}</div>
                         <div class="poster-service">Watch on {display_name}</div>
                     </div>
                 </a>
-"""
-        html += """            </div>
+""")
+        parts.append("""            </div>
         </section>
-"""
+""")
 
     # Unavailable section
     if unavailable:
-        html += f"""
+        parts.append(f"""
         <section class="section unavailable">
             <div class="section-header">
                 <div class="service-icon none">—</div>
@@ -586,47 +747,62 @@ def generate_html(results):
                 <span class="section-count">{len(unavailable)} films</span>
             </div>
             <div class="posters">
-"""
+""")
         for film in unavailable:
-            title = re.sub(r'\s*\(\d{4}\)\s*$', '', film["name"])
-            url = f"https://letterboxd.com/film/{film['slug']}/"
-            poster = film.get("poster_url")
-            other = ", ".join(film.get("other_services", [])) if film.get("other_services") else "Not streaming"
+            title = html.escape(film.get("title") or _clean_title(film["name"]))
+            url = f"https://letterboxd.com/film/{quote(film['slug'])}/"
+            poster = html.escape(film["poster_url"]) if film.get("poster_url") else None
+            other = html.escape(", ".join(film.get("other_services", []))) if film.get("other_services") else "Not streaming"
 
             if poster:
                 img_html = f'<img class="poster-img" src="{poster}" alt="{title}" loading="lazy">'
             else:
                 img_html = f'<div class="poster-placeholder">{title}</div>'
 
-            html += f"""                <a href="{url}" target="_blank" class="poster-card">
+            parts.append(f"""                <a href="{url}" target="_blank" class="poster-card">
                     {img_html}
                     <div class="poster-overlay">
                         <div class="poster-title">{title}</div>
                         <div class="poster-service">{other}</div>
                     </div>
                 </a>
-"""
-        html += """            </div>
+""")
+        parts.append("""            </div>
         </section>
-"""
+""")
 
-    html += """    </main>
+    parts.append("""    </main>
 
     <footer class="footer">
         Data from <a href="https://www.justwatch.com/" target="_blank">JustWatch</a>
     </footer>
 </body>
 </html>
-"""
-    return html
+""")
+    return "".join(parts)
 
 
 def main():
+    html_path = os.path.join(SCRIPT_DIR, "watchlist.html")
+
     # Try cache first
     cached = load_cache()
     if cached:
         print("Using cached results (less than 6 hours old)")
         results = cached
+
+        # If the page was rendered after this cache was written it already
+        # shows these exact results; skip the re-render and just open it
+        try:
+            if os.path.getmtime(html_path) >= os.path.getmtime(CACHE_FILE):
+                # The page is only styled via style.css now, so make sure
+                # it exists even on the skip path
+                with open(os.path.join(SCRIPT_DIR, "style.css"), "w") as f:
+                    f.write(PAGE_CSS)
+                webbrowser.open(f"file://{html_path}")
+                return
+        except OSError:
+            pass
     else:
         print(f"Fetching watchlist for {LETTERBOXD_USERNAME}...")
         films = get_watchlist_films(LETTERBOXD_USERNAME)
@@ -639,11 +815,13 @@ def main():
         save_cache(results)
         print("Done!")
 
-    html = generate_html(results)
+    page_html = generate_html(results)
 
-    html_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "watchlist.html")
     with open(html_path, "w") as f:
-        f.write(html)
+        f.write(page_html)
+
+    with open(os.path.join(SCRIPT_DIR, "style.css"), "w") as f:
+        f.write(PAGE_CSS)
 
     webbrowser.open(f"file://{html_path}")
 